@@ -3,7 +3,19 @@
 
 __version__ = "1.0.0"
 
-from .cli import app
-from .migration import MigrationConfig, Migrator
+import importlib
 
-__all__ = ["app", "MigrationConfig", "Migrator"]
\ No newline at end of file
+# Resolved on first access (PEP 562) so importing the package stays cheap
+_EXPORTS = {
+    "app": ".cli",
+    "MigrationConfig": ".migration",
+    "Migrator": ".migration",
+}
+
+__all__ = ["app", "MigrationConfig", "Migrator"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,10 +1,13 @@
 import typer
 from rich import print
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 import subprocess
 import os
+import logging
 from dotenv import load_dotenv
-from .migration import MigrationConfig, Migrator
+
+if TYPE_CHECKING:
+    from .migration import MigrationConfig
 
 app = typer.Typer(help="Bitbucket to GitHub migration tool")
 
@@ -32,8 +35,17 @@ def get_config(
     gh_org: str,
     dry_run: bool,
     verbose: bool,
-) -> MigrationConfig:
+    concurrency: int = 4,
+    use_cache: bool = True,
+    use_async: bool = False,
+    use_processes: bool = False,
+) -> "MigrationConfig":
     """Create configuration from CLI options or environment variables."""
+    # Imported here so --help doesn't load the HTTP and git stacks
+    from .migration import MigrationConfig
+    if verbose:
+        # Rate limit budgets and other details
+        logging.getLogger(__package__).setLevel(logging.DEBUG)
     return MigrationConfig(
         bb_username=bb_username or load_env_value(os.getenv('BB_USERNAME')),
         bb_password=bb_password or load_env_value(os.getenv('BB_PASSWORD')),
@@ -42,6 +54,10 @@ def get_config(
         gh_org=gh_org or load_env_value(os.getenv('GH_ORG')),
         dry_run=dry_run,
         verbose=verbose,
+        concurrency=concurrency,
+        use_cache=use_cache,
+        use_async=use_async,
+        use_processes=use_processes,
     )
 
 @app.command()
@@ -55,6 +71,7 @@ def test_connection(
     verbose: bool = typer.Option(False, help="Enable verbose logging"),
 ):
     """Test connections to Bitbucket and GitHub."""
+    from .migration import Migrator
     config = get_config(bb_username, bb_password, github_token, bb_workspace, gh_org, dry_run, verbose)
     tester = Migrator(config)
     success = tester.test_connections()
@@ -81,17 +98,20 @@ def migrate_repo(
     gh_org: str = typer.Option(None, help="GitHub organization"),
     dry_run: bool = typer.Option(False, help="Simulate migration without making changes"),
     verbose: bool = typer.Option(False, help="Enable verbose logging"),
+    concurrency: int = typer.Option(4, help="Number of repositories to migrate in parallel"),
+    cache: bool = typer.Option(True, help="Keep mirror clones and Bitbucket responses between runs and only fetch changes"),
+    use_async: bool = typer.Option(False, "--async", help="Fetch and create pull requests with asyncio over HTTP/2"),
+    processes: bool = typer.Option(False, "--processes", help="Migrate repositories in worker processes instead of threads"),
 ):
     """Migrate one or more repositories."""
-    config = get_config(bb_username, bb_password, github_token, bb_workspace, gh_org, dry_run, verbose)
+    from .migration import Migrator
+    config = get_config(bb_username, bb_password, github_token, bb_workspace, gh_org, dry_run, verbose, concurrency, cache, use_async, processes)
     migrator = Migrator(config)
     if not migrator.test_connections():
         raise typer.Exit(1)
     
     print(f"\n[bold]Starting migration of {len(repo_slugs)} repositories[/bold]")
-    for i, repo_slug in enumerate(repo_slugs, 1):
-        print(f"\n[bold]Migrating repository {i}/{len(repo_slugs)}: {repo_slug}[/bold]")
-        migrator.migrate_single_repository(repo_slug)
+    migrator.migrate_repositories(repo_slugs)
 
 @app.command()
 def migrate_workspace(
@@ -102,9 +122,14 @@ def migrate_workspace(
     gh_org: str = typer.Option(None, help="GitHub organization"),
     dry_run: bool = typer.Option(False, help="Simulate migration without making changes"),
     verbose: bool = typer.Option(False, help="Enable verbose logging"),
+    concurrency: int = typer.Option(4, help="Number of repositories to migrate in parallel"),
+    cache: bool = typer.Option(True, help="Keep mirror clones and Bitbucket responses between runs and only fetch changes"),
+    use_async: bool = typer.Option(False, "--async", help="Fetch and create pull requests with asyncio over HTTP/2"),
+    processes: bool = typer.Option(False, "--processes", help="Migrate repositories in worker processes instead of threads"),
 ):
     """Migrate all repositories in the Bitbucket workspace."""
-    config = get_config(bb_username, bb_password, github_token, bb_workspace, gh_org, dry_run, verbose)
+    from .migration import Migrator
+    config = get_config(bb_username, bb_password, github_token, bb_workspace, gh_org, dry_run, verbose, concurrency, cache, use_async, processes)
     migrator = Migrator(config)
     if not migrator.test_connections():
         raise typer.Exit(1)
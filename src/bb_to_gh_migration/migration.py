@@ -1,23 +1,103 @@
-import requests
+import asyncio
+import httpx
+from urllib3.util.retry import Retry
 import time
+import random
 import sys
-from datetime import datetime, timedelta  # Import time module for sleep
-from github import Github, RateLimitExceededException
-from functools import wraps
+from datetime import datetime, timedelta, timezone
 
 # from atlassian.bitbucket.cloud import Bitbucket
-import git
+import os
+import re
 import tempfile
+from pathlib import Path
+from urllib.parse import quote, urlsplit, urlunsplit
+import threading
 import logging
-from typing import Optional, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Optional, Dict, Iterable, Iterator, List, Set, Tuple
 from dataclasses import dataclass
 import json
+import sqlite3
+
+from . import __version__
+
+try:  # Optional, several times faster than the json module on large API pages
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from github import Github
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO, keep the console for the migration steps
+logging.getLogger('httpx').setLevel(logging.WARNING)
+logging.getLogger('httpcore').setLevel(logging.WARNING)
+
+PR_COMMENT_WORKERS = 8  # Parallel comment fetches per repository, started while PRs are listed
+PR_MIGRATION_WORKERS = 4  # Pull requests created in parallel per repository
+# Connections shared by all worker threads, HTTP/2 multiplexes requests over them
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+# Fail fast on unreachable hosts, but give slow API pages time to arrive
+HTTP_TIMEOUT = httpx.Timeout(30, connect=5)
+ASYNC_MAX_IN_FLIGHT = 32  # Concurrent requests per event loop in async mode
+ASYNC_LIMITS = httpx.Limits(max_connections=64)
+# Environment of every git command: abort transfers stuck below 1 KB/s for a minute
+GIT_ENV = {
+    'GIT_HTTP_LOW_SPEED_LIMIT': '1000',
+    'GIT_HTTP_LOW_SPEED_TIME': '60',
+}
+# Largest page Bitbucket serves, pull requests are capped lower
+BB_PAGELEN = 100
+BB_PR_PAGELEN = 50
+# Partial responses with only what the migration reads, "next" keeps pagination working
+BB_REPOSITORY_FIELDS = 'next,values.slug'
+BB_ISSUE_FIELDS = (
+    'next,values.title,values.state,values.created_on,values.content.raw,'
+    'values.reporter.display_name,values.links.html.href'
+)
+BB_PR_FIELDS = (
+    'next,values.id,values.title,values.state,values.description,values.created_on,'
+    'values.author.display_name,values.links.html.href,values.source.branch.name,values.destination.branch.name'
+)
+BB_COMMENT_FIELDS = 'next,values.created_on,values.content.raw,values.user.display_name'
+RETRY_TOTAL = 5
+CONNECTION_TEST_RETRY_TOTAL = 2  # PyGithub retries of the connection test
+RETRY_BACKOFF_MAX = 60  # Cap of the jittered exponential backoff, in seconds
+# 403: Rate limit, 429: Too many requests, 5xx: Server errors
+RETRY_STATUS_CODES = [403, 429, 500, 502, 503, 504]
+# Methods safe to send twice, writes are only retried when the server refused them
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+GITHUB_ACCEPT = 'application/vnd.github+json'
+ISSUE_IMPORT_ACCEPT = 'application/vnd.github.golden-comet-preview+json'
+ISSUE_IMPORT_POLL_INTERVAL = 2  # Seconds between checks of the import queue
+ISSUE_IMPORT_TIMEOUT = 300  # Give up waiting for queued imports after this many seconds
+# Set on every repository this tool creates, only those are updated by a re-run
+MIGRATION_TOPIC = 'migrated-from-bitbucket'
+# Bodies of migrated items keep their Bitbucket URL, the key to recognize them on re-runs
+MIGRATED_LINK_PATTERN = re.compile(r'^Original Link: (\S+)', re.MULTILINE)
+# Bitbucket issue state -> GitHub issue state
+ISSUE_STATE_MAPPING = {'new': 'open', 'open': 'open', 'resolved': 'closed', 'closed': 'closed'}
+
+ISSUE_BODY_TEMPLATE = """Migrated from Bitbucket
+Original Reporter: {reporter}
+Original Link: {link}
+Original State: {state}
+
+{content}"""
+PR_BODY_TEMPLATE = """Migrated from Bitbucket Pull Request
+Original Author: {author}
+Original Created On: {created_on}
+Original Link: {link}
 
-ANSI_CLEAR_LINE = '\x1b[2K'
+{description}"""
+COMMENT_BODY_TEMPLATE = """Comment by {author}
+Original comment date: {created_on}
+
+{content}"""
 
 @dataclass
 class MigrationConfig:
@@ -28,40 +108,290 @@ class MigrationConfig:
     gh_org: str
     dry_run: bool = False
     verbose: bool = False
+    concurrency: int = 4  # Number of repositories migrated in parallel
+    use_cache: bool = True  # Keep mirror clones and Bitbucket responses between runs
+    use_async: bool = False  # Fan out PR requests on an asyncio event loop instead of threads
+    use_processes: bool = False  # Migrate repositories in worker processes instead of threads
 
 
-def countdown(seconds: int) -> None:
-    """Display an interactive countdown timer with ETA"""
-    next_attempt_time = datetime.now() + timedelta(seconds=seconds)
-    time_str = time.strftime("%H:%M:%S", time.gmtime(seconds))
-    sys.stdout.write(f"Waiting for {time_str}\n")
-    sys.stdout.flush()
-    while datetime.now() < next_attempt_time:
-        remaining = (next_attempt_time - datetime.now()).seconds
-        next_time_str = next_attempt_time.strftime("%H:%M:%S")
-        sys.stdout.write(f"{ANSI_CLEAR_LINE}\rWaiting {remaining}s for rate limit (next attempt at {next_time_str})")
-        sys.stdout.flush()
-        time.sleep(0.2)
-    sys.stdout.write(f"{ANSI_CLEAR_LINE}\r")
-    sys.stdout.flush()
-
-def exponential_backoff(max_retries=5, base_delay=10):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except requests.exceptions.RetryRequest as e:
-                    if attempt == max_retries - 1:
-                        logger.error(f"Max retries ({max_retries}) exceeded: {str(e)}")
-                        raise
-                    delay = (2 ** attempt) * base_delay
-                    logger.warning(f"API rate limit hit. Retry {attempt + 1}/{max_retries}")
-                    countdown(delay)
-            return None
-        return wrapper
-    return decorator
+_countdown_lock = threading.Lock()
+
+def countdown(seconds: float) -> None:
+    """Wait for `seconds`, showing a countdown with ETA when attached to a terminal"""
+    # Only one live display can be active, concurrent waits just sleep
+    if not sys.stdout.isatty() or not _countdown_lock.acquire(blocking=False):
+        time.sleep(seconds)
+        return
+    # rich is only needed for the live display, keep it off the import path
+    from rich.progress import Progress, TextColumn
+    try:
+        next_time_str = (datetime.now() + timedelta(seconds=seconds)).strftime("%H:%M:%S")
+        status = "Waiting {:.0f}s for rate limit (next attempt at " + next_time_str + ")"
+        with Progress(TextColumn("{task.description}"), transient=True, refresh_per_second=1) as progress:
+            task = progress.add_task(status.format(seconds))
+            remaining = seconds
+            while remaining > 0:
+                step = min(1, remaining)
+                time.sleep(step)  # Repaint once per second rather than spinning
+                remaining -= step
+                progress.update(task, description=status.format(remaining))
+    finally:
+        _countdown_lock.release()
+
+def parse_json(content: bytes):
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def format_json(obj) -> str:
+    """Pretty-print JSON for verbose logging, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, indent=2, sort_keys=True)
+
+class _LazyJSON:
+    """Log argument formatted with `format_json` only if a handler actually emits the record"""
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return format_json(self.obj)
+
+def strip_credentials(url: str) -> str:
+    """Remove the user:password part from a URL so it can be stored on disk"""
+    parts = urlsplit(url)
+    netloc = parts.hostname or ''
+    if parts.port:
+        netloc += f":{parts.port}"
+    return urlunsplit(parts._replace(netloc=netloc))
+
+def cache_root() -> Path:
+    """Per-user directory holding everything kept between runs, only readable by its owner"""
+    default = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'bb2gh'
+    root = Path(os.environ.get('REPO_MIGRATOR_CACHE') or default)
+    root.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Clones of private repositories live here, don't trust a directory someone else prepared
+    info = root.stat()
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+        raise PermissionError(f"Cache directory {root} is owned by another user")
+    if info.st_mode & 0o077:
+        logger.warning(f"Cache directory {root} is accessible by other users, consider chmod 700")
+    return root
+
+class ResponseCache:
+    """Bitbucket GET responses stored on disk by URL, revalidated with their ETag"""
+
+    def __init__(self, path: Path, workspace: str):
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Private API payloads, only the owner may read them
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        path.chmod(0o600)
+        self._lock = threading.Lock()
+        # Worker processes share the file, wait for each other's writes instead of failing
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT, content BLOB)")
+            meta = dict(self._db.execute("SELECT key, value FROM meta"))
+            # Responses written for another workspace or by another version may not be reusable
+            if meta.get('workspace') != workspace or meta.get('version') != __version__:
+                self._db.execute("DELETE FROM responses")
+                self._db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [
+                    ('workspace', workspace),
+                    ('version', __version__),
+                    ('created', datetime.now().isoformat(timespec='seconds')),
+                ])
+
+    def get(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """ETag and body cached for `url`, if any"""
+        with self._lock:
+            return self._db.execute("SELECT etag, content FROM responses WHERE url = ?", (url,)).fetchone()
+
+    def put(self, url: str, etag: str, content: bytes) -> None:
+        try:
+            with self._lock, self._db:
+                self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (url, etag, content))
+        except sqlite3.Error as e:
+            # Losing a cache entry only costs a full download on the next run
+            logger.warning(f"Failed to cache response of {url}: {str(e)}")
+
+def _safe(data: Dict, *keys: str, default=None):
+    """Look up a nested key of an API object in one pass, `default` if any level is missing"""
+    for key in keys:
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return default if data is None else data
+
+def format_pr_body(pr_data: Dict) -> str:
+    """Format pull request description with migration metadata"""
+    return PR_BODY_TEMPLATE.format(
+        author=_safe(pr_data, 'author', 'display_name', default='Unknown'),
+        created_on=pr_data.get('created_on', 'Unknown'),
+        link=_safe(pr_data, 'links', 'html', 'href', default=''),
+        description=pr_data.get('description', ''),
+    )
+
+class CountdownRetry(Retry):
+    """Retry policy that waits through `countdown` so long backoffs stay visible"""
+
+    def sleep(self, response=None) -> None:
+        delay = None
+        if self.respect_retry_after_header and response is not None:
+            # The server knows best how long to wait
+            delay = self.get_retry_after(response)
+            if delay is None:
+                delay = rate_limit_reset_delay(response.headers)
+        if delay is None:
+            delay = jittered(self.get_backoff_time())
+        if delay > 0:
+            status = response.status if response is not None else "error"
+            logger.warning(f"Request failed ({status}). Retry {len(self.history)}/{len(self.history) + self.total} in {delay:.0f}s")
+            countdown(delay)
+
+
+# PyGithub's policy, the httpx transports only borrow its Retry-After parsing and backoff factor
+RETRY_POLICY = CountdownRetry(
+    total=RETRY_TOTAL,
+    backoff_factor=1,
+    status_forcelist=RETRY_STATUS_CODES,
+    allowed_methods=IDEMPOTENT_METHODS,
+    respect_retry_after_header=True,
+    raise_on_status=False,  # Hand the last response back so callers see the real status
+)
+
+
+def jittered(backoff: float) -> float:
+    """Random wait up to `backoff` so parallel workers don't all retry at the same instant"""
+    return random.uniform(0, min(backoff, RETRY_BACKOFF_MAX))
+
+def rate_limit_reset_delay(headers) -> Optional[float]:
+    """Seconds until an exhausted rate limit resets, None if the headers don't say it is"""
+    if headers.get('X-RateLimit-Remaining') != '0' or not headers.get('X-RateLimit-Reset'):
+        return None
+    try:
+        return max(0.0, float(headers['X-RateLimit-Reset']) - time.time())
+    except ValueError:
+        return None
+
+def retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait before retry `attempt`, honoring Retry-After like RETRY_POLICY does"""
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return RETRY_POLICY.parse_retry_after(retry_after)
+        except Exception:
+            pass  # Malformed header, fall back to exponential backoff
+    reset_delay = rate_limit_reset_delay(headers)
+    if reset_delay is not None:
+        return reset_delay
+    return jittered(RETRY_POLICY.backoff_factor * (2 ** attempt))
+
+def is_rate_limited(status_code: int, headers) -> bool:
+    """Whether a response refused the request because of a rate limit"""
+    if status_code == 429:
+        return True
+    return status_code == 403 and (headers.get('X-RateLimit-Remaining') == '0' or 'Retry-After' in headers)
+
+def should_retry(request: httpx.Request, response: Optional[httpx.Response] = None, error: Exception = None) -> bool:
+    """Whether a failed attempt can be sent again without risking a duplicate write"""
+    if request.method in IDEMPOTENT_METHODS:
+        return error is not None or response.status_code in RETRY_STATUS_CODES
+    # A POST that timed out or got a 5xx may still have been applied by the server
+    if error is not None:
+        return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+    return is_rate_limited(response.status_code, response.headers)
+
+
+class RateLimiter:
+    """Hosts whose rate limit is exhausted, and when requests to them can resume"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at: Dict[str, float] = {}
+
+    def update(self, host: str, headers) -> None:
+        """Record the rate limit reported by a response from `host`"""
+        if 'X-RateLimit-Remaining' in headers:
+            logger.debug(f"Rate limit of {host}: {headers['X-RateLimit-Remaining']} requests left")
+        delay = rate_limit_reset_delay(headers)
+        if delay:
+            with self._lock:
+                resume_at = time.monotonic() + delay
+                self._resume_at[host] = max(self._resume_at.get(host, 0), resume_at)
+
+    def delay(self, host: str) -> float:
+        """Seconds to hold a request to `host` so it isn't spent on a certain 403"""
+        with self._lock:
+            return max(0.0, self._resume_at.get(host, 0) - time.monotonic())
+
+
+# Shared by every client of the process, the limits are per account, not per connection
+RATE_LIMITS = RateLimiter()
+
+
+class RetryTransport(httpx.HTTPTransport):
+    """HTTP transport retrying rate limits, and server errors of idempotent requests, like RETRY_POLICY"""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RETRY_TOTAL + 1):
+            wait = RATE_LIMITS.delay(request.url.host)
+            if wait:
+                logger.warning(f"Rate limit of {request.url.host} exhausted, waiting {wait:.0f}s")
+                countdown(wait)
+            try:
+                response = super().handle_request(request)
+                RATE_LIMITS.update(request.url.host, response.headers)
+            except httpx.TransportError as e:
+                if attempt == RETRY_TOTAL or not should_retry(request, error=e):
+                    raise
+                delay, reason = retry_delay({}, attempt), str(e)
+            else:
+                if attempt == RETRY_TOTAL or not should_retry(request, response):
+                    return response
+                response.close()
+                delay, reason = retry_delay(response.headers, attempt), response.status_code
+            logger.warning(f"Request failed ({reason}). Retry {attempt + 1}/{RETRY_TOTAL} in {delay:.0f}s")
+            countdown(delay)
+
+
+class AsyncRetryTransport(httpx.AsyncHTTPTransport):
+    """Async counterpart of RetryTransport, waiting without blocking the event loop"""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RETRY_TOTAL + 1):
+            wait = RATE_LIMITS.delay(request.url.host)
+            if wait:
+                logger.warning(f"Rate limit of {request.url.host} exhausted, waiting {wait:.0f}s")
+                await asyncio.sleep(wait)
+            try:
+                response = await super().handle_async_request(request)
+                RATE_LIMITS.update(request.url.host, response.headers)
+            except httpx.TransportError as e:
+                if attempt == RETRY_TOTAL or not should_retry(request, error=e):
+                    raise
+                delay, reason = retry_delay({}, attempt), str(e)
+            else:
+                if attempt == RETRY_TOTAL or not should_retry(request, response):
+                    return response
+                await response.aclose()
+                delay, reason = retry_delay(response.headers, attempt), response.status_code
+            logger.warning(f"Request failed ({reason}). Retry {attempt + 1}/{RETRY_TOTAL} in {delay:.0f}s")
+            await asyncio.sleep(delay)
+
+
+def new_client(**kwargs) -> httpx.Client:
+    """Create a thread-safe HTTP/2 client multiplexing requests over pooled connections"""
+    transport = RetryTransport(http2=True, limits=HTTP_LIMITS)
+    return httpx.Client(transport=transport, timeout=HTTP_TIMEOUT, follow_redirects=True, **kwargs)
+
+def new_async_client(**kwargs) -> httpx.AsyncClient:
+    """Create the async counterpart of new_client for a single event loop"""
+    transport = AsyncRetryTransport(http2=True, limits=ASYNC_LIMITS)
+    return httpx.AsyncClient(transport=transport, timeout=HTTP_TIMEOUT, follow_redirects=True, **kwargs)
 
 
 class BitbucketConnector:
@@ -69,15 +399,24 @@ class BitbucketConnector:
         self.config = config
         self.base_url = "https://api.bitbucket.org/2.0"
         self.auth = (self.config.bb_username, self.config.bb_password)
-        self.session = requests.Session()
-        self.session.auth = self.auth
+        self.session = new_client(auth=self.auth)
+        self.responses = (
+            ResponseCache(cache_root() / config.bb_workspace / 'responses.sqlite', config.bb_workspace)
+            if config.use_cache else None
+        )
 
-    @exponential_backoff(max_retries=5, base_delay=1)
     def _make_request(self, method: str, url: str, params: Dict = None, data: Dict = None) -> Optional[Dict]:
-        """Helper method to make API requests with exponential backoff"""
+        """Helper method to make API requests, the client retries rate limits and server errors"""
         try:
-            response = self.session.request(method, url, params=params, json=data)
-            
+            request = self.session.build_request(method, url, params=params, json=data)
+            cached = self.responses.get(str(request.url)) if self.responses and method == 'GET' else None
+            if cached:
+                request.headers['If-None-Match'] = cached[0]
+            response = self.session.send(request)
+
+            if cached and response.status_code == 304:  # Unchanged since the last run
+                return parse_json(cached[1])
+
             # Status codes that should not trigger retries
             if response.status_code == 404:  # Resource not found
                 logger.info(f"Resource not found (404): {url}")
@@ -89,17 +428,15 @@ class BitbucketConnector:
                 logger.error(f"Unauthorized (401): {url}")
                 response.raise_for_status()
             
-            # Status codes that should trigger retries
-            elif response.status_code in [403, 429, 500, 502, 503, 504]:
-                # 403: Rate limit, 429: Too many requests, 5xx: Server errors
-                logger.warning(f"Received status code {response.status_code}, will retry: {url}")
-                raise requests.exceptions.RetryRequest(response=response)
+            # Status codes that are still failing once retries are exhausted
+            elif response.status_code in RETRY_STATUS_CODES:
+                logger.error(f"Max retries ({RETRY_TOTAL}) exceeded, status code {response.status_code}: {url}")
             
             response.raise_for_status()
-            return response.json()
+            if self.responses and method == 'GET' and 'ETag' in response.headers:
+                self.responses.put(str(request.url), response.headers['ETag'], response.content)
+            return parse_json(response.content)
             
-        except requests.exceptions.RetryRequest:
-            raise
         except Exception as e:
             logger.error(f"Request failed: {e}")
             raise
@@ -107,10 +444,9 @@ class BitbucketConnector:
     def test_connection(self) -> bool:
         """Test Bitbucket connection and permissions"""
         try:
-            url = f"{self.base_url}/user"
-            response = requests.get(url, auth=self.auth, timeout=15)  # Add timeout here
-            response.raise_for_status()
-            user_data = response.json()
+            user_data = self._make_request('GET', f"{self.base_url}/user")
+            if not user_data:
+                return False
             logger.info(
                 f"Successfully connected to Bitbucket Cloud as {user_data['display_name']} ({user_data['username']})"
             )
@@ -123,16 +459,27 @@ class BitbucketConnector:
             logger.error(f"Failed to connect to Bitbucket Cloud: {str(e)}")
             return False
 
+    def _paginate(self, url: str, params: Optional[Dict] = None, pagelen: int = BB_PAGELEN) -> Iterator[List[Dict]]:
+        """Yield the pages of a listing, fetching the next one while the caller handles the current"""
+        params = {**(params or {}), 'pagelen': pagelen}
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._make_request, 'GET', url, params=params)
+            try:
+                while pending:
+                    data = pending.result()
+                    if not data:
+                        return
+                    url = data.get("next")  # Already carries the query of the first request
+                    pending = executor.submit(self._make_request, 'GET', url) if url else None
+                    yield data.get("values", [])
+            finally:
+                if pending:
+                    pending.cancel()  # Caller stopped early
+
     def get_repositories(self) -> List[Dict]:
         """Get all repositories in the workspace"""
-        repos = []
         url = f"{self.base_url}/repositories/{self.config.bb_workspace}"
-        while url:
-            data = self._make_request('GET', url)
-            if not data:
-                break
-            repos.extend(data.get("values", []))
-            url = data.get("next")
+        repos = [repo for page in self._paginate(url, {'fields': BB_REPOSITORY_FIELDS}) for repo in page]
         if self.config.verbose:
             repo_names = [repo["slug"] for repo in repos]
             logger.info(f"Retrieved repositories: {repo_names}")
@@ -143,63 +490,100 @@ class BitbucketConnector:
         url = f"{self.base_url}/repositories/{self.config.bb_workspace}/{repo_slug}"
         repo = self._make_request('GET', url)
         if repo and self.config.verbose:
-            logger.info(
-                f"Repository details: {json.dumps(repo, indent=2, sort_keys=True)}"
-            )
+            logger.info("Repository details: %s", _LazyJSON(repo))
         return repo
 
-    def get_issues(self, repo_slug: str) -> List[Dict]:
-        """Get all issues for a repository"""
-        issues = []
+    def iter_issues(self, repo_slug: str) -> Iterator[Dict]:
+        """Yield the issues of a repository, fetching the next page only when needed"""
         url = f"{self.base_url}/repositories/{self.config.bb_workspace}/{repo_slug}/issues"
-        data = self._make_request('GET', url)
-        if data is None:  # Repository doesn't have issues enabled
+        pages = 0
+        retrieved = 0
+        for page in self._paginate(url, {'fields': BB_ISSUE_FIELDS}):
+            if pages:
+                logger.info(f"Retrieved {retrieved} issues for {repo_slug}")
+            pages += 1
+            retrieved += len(page)
+            yield from page
+        if not pages:  # Repository doesn't have issues enabled
             logger.info(f"Issues are not enabled for repository {repo_slug}")
-            return []
-            
-        while data:
-            issues.extend(data.get("values", []))
-            url = data.get("next")
-            if not url:
-                break
-            data = self._make_request('GET', url)
-            if data:
-                logger.info(f"Retrieved {len(issues)} issues for {repo_slug}")
-            
+
+    def get_issues(self, repo_slug: str) -> List[Dict]:
+        """Get all issues for a repository"""
+        issues = list(self.iter_issues(repo_slug))
         if self.config.verbose:
-            logger.info(f"Issues for {repo_slug}: {json.dumps(issues, indent=2, sort_keys=True)}")
+            logger.info("Issues for %s: %s", repo_slug, _LazyJSON(issues))
         return issues
 
-    def get_pull_requests(self, repo_slug: str) -> List[Dict]:
-        """Get all open pull requests for a repository, including comments"""
+    def count_issues(self, repo_slug: str) -> int:
+        """Count the issues of a repository without downloading them"""
+        url = f"{self.base_url}/repositories/{self.config.bb_workspace}/{repo_slug}/issues"
+        data = self._make_request('GET', url, params={'fields': 'size'})
+        if data is None:  # Repository doesn't have issues enabled
+            return 0
+        return data.get("size", 0)
+
+    def get_pull_requests(self, repo_slug: str, include_comments: bool = True) -> List[Dict]:
+        """Get all open pull requests for a repository, including comments unless disabled"""
         prs = []
         url = f"{self.base_url}/repositories/{self.config.bb_workspace}/{repo_slug}/pullrequests"
-        params = {'state': 'OPEN', 'pagelen': 50}  # Only fetch open PRs
-        
-        while url:
-            data = self._make_request('GET', url, params=params)
-            if not data:
-                break
-            for pr in data.get("values", []):
-                pr_id = pr.get('id')
-                pr_comments = self.get_pull_request_comments(repo_slug, pr_id)
-                pr['comments'] = pr_comments
-                prs.append(pr)
-            url = data.get("next")
+        params = {'state': 'OPEN', 'fields': BB_PR_FIELDS}  # Only fetch open PRs
+        fetch_comments = include_comments and not self.config.use_async
+
+        # Comments of distinct PRs are independent, fetch them as soon as their PR is listed
+        with ThreadPoolExecutor(max_workers=PR_COMMENT_WORKERS) as executor:
+            futures = {}
+            for page in self._paginate(url, params, pagelen=BB_PR_PAGELEN):
+                for pr in page:
+                    # Formatted here so sending the PR later only does network work
+                    pr['_formatted_body'] = format_pr_body(pr)
+                    if fetch_comments:
+                        futures[executor.submit(self.get_pull_request_comments, repo_slug, pr.get('id'))] = pr
+                prs.extend(page)
+            for future in as_completed(futures):
+                futures[future]['comments'] = future.result()
+        if prs and include_comments and self.config.use_async:
+            # One event loop and client for the comments of every page
+            asyncio.run(self._aget_comments_for(repo_slug, prs))
         if self.config.verbose:
             logger.info(f"Total open PRs retrieved: {len(prs)}")
         return prs
 
     def get_pull_request_comments(self, repo_slug: str, pr_id: int) -> List[Dict]:
         """Get all comments for a specific pull request"""
+        url = f"{self.base_url}/repositories/{self.config.bb_workspace}/{repo_slug}/pullrequests/{pr_id}/comments"
+        comments = [comment for page in self._paginate(url, {'fields': BB_COMMENT_FIELDS}) for comment in page]
+        if self.config.verbose:
+            logger.info(f"Retrieved {len(comments)} comments for PR #{pr_id}")
+        return comments
+
+    async def _aget_comments_for(self, repo_slug: str, prs: List[Dict]) -> None:
+        """Fetch the comments of all `prs` concurrently over one HTTP/2 connection"""
+        semaphore = asyncio.Semaphore(ASYNC_MAX_IN_FLIGHT)
+        async with new_async_client(auth=self.auth) as client:
+            results = await asyncio.gather(*[
+                self._aget_pull_request_comments(client, semaphore, repo_slug, pr.get('id')) for pr in prs
+            ])
+        for pr, comments in zip(prs, results):
+            pr['comments'] = comments
+
+    async def _aget_pull_request_comments(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, repo_slug: str, pr_id: int
+    ) -> List[Dict]:
+        """Async counterpart of get_pull_request_comments"""
         comments = []
         url = f"{self.base_url}/repositories/{self.config.bb_workspace}/{repo_slug}/pullrequests/{pr_id}/comments"
-        while url:
-            data = self._make_request('GET', url)
-            if not data:
-                break
-            comments.extend(data.get("values", []))
-            url = data.get("next")
+        params = {'pagelen': BB_PAGELEN, 'fields': BB_COMMENT_FIELDS}
+        async with semaphore:
+            while url:
+                response = await client.get(url, params=params)
+                if response.status_code == 404:
+                    logger.info(f"Resource not found (404): {url}")
+                    break
+                response.raise_for_status()
+                data = parse_json(response.content)
+                comments.extend(data.get("values", []))
+                url = data.get("next")
+                params = None  # "next" already carries the query
         if self.config.verbose:
             logger.info(f"Retrieved {len(comments)} comments for PR #{pr_id}")
         return comments
@@ -212,31 +596,36 @@ class BitbucketConnector:
 class GitHubConnector:
     def __init__(self, config: MigrationConfig):
         self.config = config
+        self.api_url = "https://api.github.com"
         self.client = self._setup_client()
-        self.session = requests.Session()
-        self.session.headers.update({"Authorization": f"token {self.config.github_token}"})
+        self.headers = {"Authorization": f"token {self.config.github_token}", "Accept": GITHUB_ACCEPT}
+        self.session = new_client(headers=self.headers)
 
-    def _setup_client(self) -> Github:
+    def _setup_client(self) -> "Github":
+        # PyGithub is slow to import and only used for the connection test
+        from github import Github
         try:
-            # Disable PyGithub's retry mechanism by setting retry=False
-            client = Github(self.config.github_token, retry=False)
-            # Test connection
-            client.get_user().login
+            # PyGithub only runs the connection test's GETs, a few retries are enough to report a failure
+            client = Github(self.config.github_token, retry=RETRY_POLICY.new(total=CONNECTION_TEST_RETRY_TOTAL))
+            # Test connection, keeping the fetched user for test_connection
+            self._user = client.get_user()
+            self._user.login
             logger.info("Successfully connected to GitHub")
             return client
         except Exception as e:
             logger.error(f"Failed to connect to GitHub: {str(e)}")
             raise
 
-    @exponential_backoff(max_retries=5, base_delay=1)
-    def _make_request(self, func):
-        """Execute GitHub API calls with exponential backoff"""
-        return func()
+    def _make_request(self, method: str, path: str, data: Dict = None, headers: Dict = None) -> Dict:
+        """Call the GitHub REST API directly, one HTTP request per call"""
+        response = self.session.request(method, f"{self.api_url}{path}", json=data, headers=headers)
+        response.raise_for_status()
+        return parse_json(response.content)
 
     def test_connection(self) -> bool:
         """Test GitHub connection and permissions"""
         try:
-            user = self.client.get_user()
+            user = self._user
             org = self.client.get_organization(self.config.gh_org)
             logger.info(f"Successfully connected to GitHub as {user.login}")
             logger.info(f"Access to organization: {org.login}")
@@ -248,7 +637,37 @@ class GitHubConnector:
             logger.error(f"Failed to access organization: {str(e)}")
             return False
 
-    @exponential_backoff(max_retries=5, base_delay=1)
+    def _list(self, path: str, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Yield every item of a GitHub listing, following its Link headers"""
+        url = f"{self.api_url}{path}"
+        params = {**(params or {}), 'per_page': 100}
+        while url:
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            yield from parse_json(response.content)
+            url = response.links.get('next', {}).get('url')
+            params = None  # The next link already carries the query
+
+    def get_repository(self, name: str) -> Optional[Dict]:
+        """Get a repository of the organization, None if it doesn't exist"""
+        try:
+            return self._make_request('GET', f"/repos/{self.config.gh_org}/{name}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_migrated_links(self, repo_name: str) -> Tuple[Set[str], Set[str]]:
+        """Bitbucket URLs of the issues and of the pull requests already migrated to `repo_name`"""
+        path = f"/repos/{self.config.gh_org}/{repo_name}"
+        # The import API queues issues, pull requests never carry the migration label
+        issues = self._list(f"{path}/issues", {'state': 'all', 'labels': 'migrated-from-bitbucket'})
+        prs = self._list(f"{path}/pulls", {'state': 'all'})
+        return (
+            {link for issue in issues for link in MIGRATED_LINK_PATTERN.findall(issue.get('body') or '')},
+            {link for pr in prs for link in MIGRATED_LINK_PATTERN.findall(pr.get('body') or '')},
+        )
+
     def create_repository(
         self, name: str, description: str, private: bool
     ) -> Optional[Dict]:
@@ -256,108 +675,243 @@ class GitHubConnector:
         if self.config.dry_run:
             logger.info(f"[DRY RUN] Would create repository: {name}")
             return {"name": name}
-        org = self.client.get_organization(self.config.gh_org)
-        def create_repo():
-            return org.create_repo(name=name, description=description, private=private)
-        repo = self._make_request(create_repo)
-        if repo:
-            logger.info(f"Created repository: {repo.full_name}")
+        try:
+            repo = self._make_request(
+                'POST',
+                f"/orgs/{self.config.gh_org}/repos",
+                {"name": name, "description": description, "private": private},
+            )
+        except Exception as e:
+            logger.error(f"Failed to create repository {name}: {str(e)}")
+            return None
+        logger.info(f"Created repository: {repo['full_name']}")
+        try:
+            self._make_request('PUT', f"/repos/{repo['full_name']}/topics", {"names": [MIGRATION_TOPIC]})
+        except Exception as e:
+            # Without the topic a re-run refuses to touch the repository, which is the safe side
+            logger.warning(f"Failed to mark {repo['full_name']} as migrated: {str(e)}")
         return repo
 
     def get_clone_url(self, repo_name: str) -> str:
         """Get HTTPS clone URL with auth embedded"""
         return f"https://{self.config.github_token}@github.com/{self.config.gh_org}/{repo_name}.git"
 
-    @exponential_backoff(max_retries=5, base_delay=1)
-    def create_issue(self, repo_name: str, issue_data: Dict) -> Optional[Dict]:
-        """Create a new issue with error handling"""
+    def import_issue(self, repo_name: str, payload: Dict) -> Dict:
+        """Queue an issue with its state and comments, returns the import status"""
+        path = f"/repos/{self.config.gh_org}/{repo_name}/import/issues"
+        return self._make_request('POST', path, payload, headers={'Accept': ISSUE_IMPORT_ACCEPT})
+
+    def bulk_import_issues(self, repo_name: str, issues: Iterable[Dict]) -> int:
+        """Import issues through the issue import API, returns how many GitHub imported"""
         if self.config.dry_run:
-            logger.info(f"[DRY RUN] Would create issue: {issue_data.get('title')}")
-            return None
-        org = self.client.get_organization(self.config.gh_org)
-        repo = org.get_repo(repo_name)
-        def create_issue():
+            for issue_data in issues:
+                logger.info(f"[DRY RUN] Would import issue: {issue_data.get('title')}")
+            return 0
+        queued = {}
+        # GitHub's clock decides which imports the listing returns, the local one is only a fallback
+        since = None
+        started = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        for issue_data in issues:
             title = issue_data.get('title', 'No title')
-            body = f"""Migrated from Bitbucket
-Original Reporter: {issue_data.get('reporter', {}).get('display_name', 'Unknown')}
-Original Link: {issue_data.get('links', {}).get('html', {}).get('href', '')}
-Original State: {issue_data.get('state', 'Unknown')}
-
-{issue_data.get('content', {}).get('raw', '')}"""
-            issue = repo.create_issue(
-                title=title,
-                body=body,
-                labels=['migrated-from-bitbucket', issue_data.get('state', 'Unknown')],
-            )
-            state_mapping = {'new': 'open', 'open': 'open', 'resolved': 'closed', 'closed': 'closed'}
-            out_state = state_mapping.get(issue_data.get('state'), 'open')
-            issue.edit(state=out_state)
-            return issue
-        issue = self._make_request(create_issue)
-        if issue:
-            logger.info(f"Created issue: {issue.title}")
-        return issue
-
-    @exponential_backoff(max_retries=5, base_delay=1)
-    def create_pull_request(self, repo_name: str, pr_data: Dict) -> Optional[Dict]:
+            try:
+                status = self.import_issue(repo_name, self._issue_import_payload(issue_data))
+                queued[status['id']] = title
+                since = since or status.get('created_at')
+                logger.info(f"Queued import of issue: {title}")
+            except Exception as e:
+                logger.error(f"Failed to import issue {title}: {str(e)}")
+        return self._wait_for_issue_imports(repo_name, queued, since or started) if queued else 0
+
+    def _issue_import_payload(self, issue_data: Dict) -> Dict:
+        """Build the import request for a Bitbucket issue"""
+        state = issue_data.get('state', 'Unknown')
+        issue = {
+            "title": issue_data.get('title', 'No title'),
+            "body": self._format_issue_body(issue_data),
+            "closed": ISSUE_STATE_MAPPING.get(state, 'open') == 'closed',
+            "labels": ['migrated-from-bitbucket', state],
+        }
+        if issue_data.get('created_on'):
+            issue["created_at"] = issue_data['created_on']
+        return {"issue": issue, "comments": []}
+
+    def _wait_for_issue_imports(self, repo_name: str, queued: Dict[int, str], since: str) -> int:
+        """Poll the imports listed since `since` until GitHub processed the `queued` ids, returns how many succeeded"""
+        # One listing per poll covers the whole batch, imports of earlier runs don't match an id
+        path = f"/repos/{self.config.gh_org}/{repo_name}/import/issues"
+        headers = {'Accept': ISSUE_IMPORT_ACCEPT}
+        pending = dict(queued)
+        imported = 0
+        deadline = time.monotonic() + ISSUE_IMPORT_TIMEOUT
+        while pending and time.monotonic() < deadline:
+            try:
+                statuses = self._make_request('GET', f"{path}?since={quote(since)}", headers=headers)
+            except Exception as e:
+                logger.warning(f"Failed to check the issue imports of {repo_name}: {str(e)}")
+                statuses = []
+            for status in statuses:
+                if status.get('id') not in pending or status.get('status') == 'pending':
+                    continue
+                title = pending.pop(status['id'])
+                if status.get('status') == 'imported':
+                    imported += 1
+                else:
+                    logger.error(f"GitHub failed to import issue {title}: {self._import_errors(path, status)}")
+            if pending:
+                time.sleep(ISSUE_IMPORT_POLL_INTERVAL)
+        for import_id, title in pending.items():
+            logger.warning(f"Import {import_id} of issue {title} still pending after {ISSUE_IMPORT_TIMEOUT}s")
+        return imported
+
+    def _import_errors(self, path: str, status: Dict) -> object:
+        """Errors of a failed import, the listing leaves them out so they are fetched separately"""
+        if 'errors' in status:
+            return status['errors']
+        try:
+            return self._make_request('GET', f"{path}/{status['id']}", headers={'Accept': ISSUE_IMPORT_ACCEPT}).get('errors')
+        except Exception as e:
+            return str(e)
+
+    def create_pull_requests(self, repo_name: str, prs: List[Dict], branches: Optional[Set[str]] = None) -> int:
+        """Create pull requests concurrently, returns how many were created"""
+        if self.config.use_async and not self.config.dry_run:
+            return asyncio.run(self._acreate_pull_requests(repo_name, prs, branches))
+        # Each worker migrates a whole PR so its comments keep their order
+        with ThreadPoolExecutor(max_workers=PR_MIGRATION_WORKERS) as executor:
+            created = executor.map(lambda pr: self.create_pull_request(repo_name, pr, branches), prs)
+            return sum(1 for pr in created if pr)
+
+    def create_pull_request(
+        self, repo_name: str, pr_data: Dict, branches: Optional[Set[str]] = None
+    ) -> Optional[Dict]:
+        """Create a pull request with its comments, `branches` lists the branches pushed to GitHub"""
         try:
             if self.config.dry_run:
                 logger.info(f"[DRY RUN] Would create pull request: {pr_data.get('title')}")
                 return None
 
-            org = self.client.get_organization(self.config.gh_org)
-            repo = org.get_repo(repo_name)
-
-            # Get branch information
-            source_branch = pr_data.get('source', {}).get('branch', {}).get('name')
-            target_branch = pr_data.get('destination', {}).get('branch', {}).get('name')
-
-            if not source_branch or not target_branch:
-                logger.error(f"Missing branch information for PR: {pr_data.get('title')}")
+            payload = self._pull_request_payload(pr_data, branches)
+            if payload is None:
                 return None
 
             # Create pull request
-            pr = repo.create_pull(
-                title=pr_data.get("title", "No title"),
-                body=self._format_pr_body(pr_data),
-                head=source_branch,
-                base=target_branch
-            )
+            pr = self._make_request('POST', f"/repos/{self.config.gh_org}/{repo_name}/pulls", payload)
 
             # Handle comments
-            self._add_pr_comments(pr, pr_data.get('comments', []))
+            self._add_pr_comments(repo_name, pr['number'], pr_data.get('comments', []))
 
-            logger.info(f"Created pull request: {pr.title}")
+            logger.info(f"Created pull request: {pr['title']}")
             return pr
 
         except Exception as e:
             logger.error(f"Failed to create pull request {pr_data.get('title')}: {str(e)}")
             return None
 
-    def _add_pr_comments(self, pr, comments: List[Dict]) -> None:
+    def _pull_request_payload(self, pr_data: Dict, branches: Optional[Set[str]]) -> Optional[Dict]:
+        """Build the GitHub pull request for `pr_data`, None if it can't be created"""
+        # Get branch information
+        source_branch = _safe(pr_data, 'source', 'branch', 'name')
+        target_branch = _safe(pr_data, 'destination', 'branch', 'name')
+
+        if not source_branch or not target_branch:
+            logger.error(f"Missing branch information for PR: {pr_data.get('title')}")
+            return None
+
+        # GitHub rejects PRs on branches it doesn't have, check the local mirror instead of asking
+        if branches is not None and not {source_branch, target_branch} <= branches:
+            logger.warning(f"Skipping PR {pr_data.get('title')}: branch no longer exists")
+            return None
+
+        return {
+            "title": pr_data.get("title", "No title"),
+            "body": self._format_pr_body(pr_data),
+            "head": source_branch,
+            "base": target_branch,
+        }
+
+    def _add_pr_comments(self, repo_name: str, pr_number: int, comments: List[Dict]) -> None:
         """Add comments to a pull request"""
         if not comments:
             return
         
         logger.info(f"Migrating {len(comments)} comments")
+        path = f"/repos/{self.config.gh_org}/{repo_name}/issues/{pr_number}/comments"
+        # Posted one after the other, GitHub orders the conversation by creation time
         for comment in comments:
-            try:
-                comment_body = f"""Comment by {comment.get('user', {}).get('display_name', 'Unknown')}
-Original comment date: {comment.get('created_on', 'Unknown')}
+            self._post_comment(path, comment)
+
+    def _post_comment(self, path: str, comment: Dict) -> bool:
+        """Post a single comment, a failure is logged without stopping the others"""
+        try:
+            self._make_request('POST', path, {"body": self._format_comment_body(comment)})
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to create comment: {str(e)}")
+            return False
 
-{comment.get('content', {}).get('raw', '')}"""
-                pr.create_issue_comment(comment_body)
+    async def _acreate_pull_requests(self, repo_name: str, prs: List[Dict], branches: Optional[Set[str]]) -> int:
+        """Async counterpart of create_pull_requests, sharing one HTTP/2 connection"""
+        semaphore = asyncio.Semaphore(PR_MIGRATION_WORKERS)
+        async with new_async_client(base_url=self.api_url, headers=self.headers) as client:
+            created = await asyncio.gather(*[
+                self._acreate_pull_request(client, semaphore, repo_name, pr, branches) for pr in prs
+            ])
+        return sum(1 for pr in created if pr)
+
+    async def _acreate_pull_request(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        repo_name: str,
+        pr_data: Dict,
+        branches: Optional[Set[str]],
+    ) -> Optional[Dict]:
+        """Async counterpart of create_pull_request"""
+        payload = self._pull_request_payload(pr_data, branches)
+        if payload is None:
+            return None
+        async with semaphore:
+            try:
+                response = await client.post(f"/repos/{self.config.gh_org}/{repo_name}/pulls", json=payload)
+                response.raise_for_status()
+                pr = parse_json(response.content)
+                comments = pr_data.get('comments', [])
+                if comments:
+                    logger.info(f"Migrating {len(comments)} comments")
+                path = f"/repos/{self.config.gh_org}/{repo_name}/issues/{pr['number']}/comments"
+                # Posted one after the other, GitHub orders the conversation by creation time
+                for comment in comments:
+                    try:
+                        response = await client.post(path, json={"body": self._format_comment_body(comment)})
+                        response.raise_for_status()
+                    except Exception as e:
+                        logger.warning(f"Failed to create comment: {str(e)}")
+                logger.info(f"Created pull request: {pr['title']}")
+                return pr
             except Exception as e:
-                logger.warning(f"Failed to create comment: {str(e)}")
+                logger.error(f"Failed to create pull request {pr_data.get('title')}: {str(e)}")
+                return None
 
-    def _format_pr_body(self, pr_data: Dict) -> str:
-        """Format pull request description with migration metadata"""
-        return f"""Migrated from Bitbucket Pull Request
-Original Author: {pr_data.get('author', {}).get('display_name', 'Unknown')}
-Original Created On: {pr_data.get('created_on', 'Unknown')}
-Original Link: {pr_data.get('links', {}).get('html', {}).get('href', '')}
+    def _format_comment_body(self, comment: Dict) -> str:
+        """Format pull request comment with migration metadata"""
+        return COMMENT_BODY_TEMPLATE.format(
+            author=_safe(comment, 'user', 'display_name', default='Unknown'),
+            created_on=comment.get('created_on', 'Unknown'),
+            content=_safe(comment, 'content', 'raw', default=''),
+        )
 
-{pr_data.get('description', '')}"""
+    def _format_issue_body(self, issue_data: Dict) -> str:
+        """Format issue description with migration metadata"""
+        return ISSUE_BODY_TEMPLATE.format(
+            reporter=_safe(issue_data, 'reporter', 'display_name', default='Unknown'),
+            link=_safe(issue_data, 'links', 'html', 'href', default=''),
+            state=issue_data.get('state', 'Unknown'),
+            content=_safe(issue_data, 'content', 'raw', default=''),
+        )
+
+    def _format_pr_body(self, pr_data: Dict) -> str:
+        """Pull request description, pre-built by BitbucketConnector.get_pull_requests when possible"""
+        return pr_data.get('_formatted_body') or format_pr_body(pr_data)
 
 
 class Migrator:
@@ -365,6 +919,13 @@ class Migrator:
         self.config = config
         self.bb = BitbucketConnector(config)
         self.gh = GitHubConnector(config)
+        self._repositories: Optional[List[Dict]] = None
+
+    def _get_repositories(self) -> List[Dict]:
+        """List workspace repositories once and reuse the listing afterwards"""
+        if self._repositories is None:
+            self._repositories = self.bb.get_repositories()
+        return self._repositories
 
     def test_connections(self) -> bool:
         """Test both Bitbucket and GitHub connections"""
@@ -376,23 +937,23 @@ class Migrator:
     def test_repository_listing(self) -> None:
         """Test listing repositories from Bitbucket"""
         logger.info("Testing repository listing...")
-        repos = self.bb.get_repositories()
+        repos = self._get_repositories()
         
         for repo in repos:
             repo_slug = repo['slug']
             logger.info(f"\nRepository: {repo_slug}")
             
-            # Get issues
-            issues = self.bb.get_issues(repo_slug)
+            # Get issues, only their number unless verbose
             if self.config.verbose:
+                issues = self.bb.get_issues(repo_slug)
                 logger.info(f"Issues ({len(issues)}):")
                 for issue in issues:
                     logger.info(f"  - [{issue.get('state', 'unknown')}] {issue.get('title', 'No title')}")
             else:
-                logger.info(f"Issues: {len(issues)}")
+                logger.info(f"Issues: {self.bb.count_issues(repo_slug)}")
             
-            # Get pull requests
-            prs = self.bb.get_pull_requests(repo_slug)
+            # Get pull requests, comments are not needed for the listing
+            prs = self.bb.get_pull_requests(repo_slug, include_comments=False)
             logger.info(f"Pull Requests ({len(prs)}):")
             if self.config.verbose:
                 for pr in prs:
@@ -400,14 +961,35 @@ class Migrator:
 
     def migrate_workspace(self) -> None:
         """Migrate all repositories in the Bitbucket workspace."""
-        repos = self.bb.get_repositories()
-        for repo in repos:
-            repo_slug = repo['slug']
-            if self.config.dry_run:
+        repos = self._get_repositories()
+        repo_slugs = [repo['slug'] for repo in repos]
+        if self.config.dry_run:
+            for repo_slug in repo_slugs:
                 logger.info(f"[DRY RUN] Would migrate repository: {repo_slug}")
-            else:
-                logger.info(f"Starting migration for repository: {repo_slug}")
-                self.migrate_single_repository(repo_slug)
+            return
+        self.migrate_repositories(repo_slugs)
+
+    def migrate_repositories(self, repo_slugs: List[str]) -> None:
+        """Migrate several repositories, running up to `concurrency` migrations in parallel"""
+        total = len(repo_slugs)
+        workers = max(1, min(self.config.concurrency, total))
+        logger.info(f"Migrating {total} repositories with {workers} workers")
+        if self.config.use_processes:
+            # Connections can't be pickled, each worker builds its own Migrator from the config once
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self.config, logger.getEffectiveLevel()))
+            submit = lambda repo_slug: executor.submit(_migrate_one, repo_slug)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="migrate")
+            submit = lambda repo_slug: executor.submit(self.migrate_single_repository, repo_slug)
+        with executor:
+            futures = {submit(repo_slug): repo_slug for repo_slug in repo_slugs}
+            for done, future in enumerate(as_completed(futures), 1):
+                repo_slug = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Migration of {repo_slug} failed: {str(e)}")
+                logger.info(f"Finished repository {done}/{total}: {repo_slug}")
 
     def migrate_single_repository(self, repo_slug: str) -> None:
         """Migrate a single repository (test mode if dry_run is True)"""
@@ -421,10 +1003,10 @@ class Migrator:
             logger.error(f"Failed to get details for {repo_slug}. Aborting migration.")
             return
 
-        # Step 2: Get issues
-        logger.info(f"{mode}Step 2: Getting issues")
-        issues = self.bb.get_issues(repo_slug)
-        logger.info(f"Found {len(issues)} issues")
+        # Step 2: Count issues, they are streamed from Bitbucket while migrating
+        logger.info(f"{mode}Step 2: Counting issues")
+        issue_count = self.bb.count_issues(repo_slug)
+        logger.info(f"Found {issue_count} issues")
 
         # Step 3: Get pull requests
         logger.info(f"{mode}Step 3: Getting open pull requests")
@@ -437,48 +1019,144 @@ class Migrator:
             return
 
         logger.info("Step 4: Creating repository and migrating content")
-        new_repo = self.gh.create_repository(
-            name=repo_slug,
-            description=repo_details.get("description", ""),
-            private=repo_details.get("is_private", True),
-        )
+        # A re-run updates a repository this tool created and only adds what it doesn't have yet
+        new_repo = self.gh.get_repository(repo_slug)
+        migrated_issues, migrated_prs = set(), set()
+        if new_repo and MIGRATION_TOPIC not in new_repo.get('topics', []):
+            # Pushing a mirror would delete every branch and tag Bitbucket doesn't have
+            logger.error(f"GitHub repository {new_repo['full_name']} was not created by this tool. Aborting migration.")
+            return
+        existing = new_repo is not None
+        if existing:
+            logger.info(f"Repository {new_repo['full_name']} was migrated before, updating it")
+            migrated_issues, migrated_prs = self.gh.get_migrated_links(repo_slug)
+        else:
+            new_repo = self.gh.create_repository(
+                name=repo_slug,
+                description=repo_details.get("description", ""),
+                private=repo_details.get("is_private", True),
+            )
         if not new_repo:
             logger.error(f"Failed to create GitHub repository for {repo_slug}. Aborting migration.")
             return
 
         source_url = self.bb.get_clone_url(repo_slug)
         target_url = self.gh.get_clone_url(repo_slug)
-        if not self._migrate_repository_content(repo_slug, source_url, target_url):
+        # Forks borrow the objects they share with their parent's cached mirror
+        parent_workspace, _, parent_slug = (repo_details.get("parent") or {}).get("full_name", "").partition("/")
+        reference_slug = parent_slug if parent_workspace == self.config.bb_workspace else None
+        branches = self._migrate_repository_content(repo_slug, source_url, target_url, reference_slug, existing)
+        if branches is None:
             logger.error(f"Failed to migrate repository content for {repo_slug}")
             return
 
         # Migrate all items
         if not self.config.dry_run:
             logger.info("Step 5: Migrating issues")
-            for issue in issues:
-                self.gh.create_issue(repo_slug, issue)
-            logger.info(f"Migrated {len(issues)} issues")
+            issues = self._skip_migrated(self.bb.iter_issues(repo_slug), migrated_issues)
+            imported = self.gh.bulk_import_issues(repo_slug, issues)
+            logger.info(f"Migrated {imported}/{issue_count} issues ({len(migrated_issues)} migrated before)")
 
             # Migrate pull requests
             logger.info("Step 6: Migrating pull requests")
-            for pr in prs:
-                self.gh.create_pull_request(repo_slug, pr)
-            logger.info(f"Migrated {len(prs)} pull requests")
+            prs = list(self._skip_migrated(prs, migrated_prs))
+            migrated = self.gh.create_pull_requests(repo_slug, prs, branches)
+            logger.info(f"Migrated {migrated}/{len(prs)} pull requests")
 
         logger.info(f"Successfully completed migration for {repo_slug}")
 
-    def _migrate_repository_content(self, repo_slug: str, source_url: str, target_url: str) -> bool:
-        """Clone repository and push to new remote"""
+    def _skip_migrated(self, items: Iterable[Dict], migrated_links: Set[str]) -> Iterator[Dict]:
+        """Leave out the issues or pull requests whose Bitbucket URL is in `migrated_links`"""
+        for item in items:
+            if _safe(item, 'links', 'html', 'href') in migrated_links:
+                logger.info(f"Skipping {item.get('title')}: already migrated")
+                continue
+            yield item
+
+    def _cache_path(self, repo_slug: str) -> Path:
+        """Location of the cached mirror clone of a repository"""
+        return cache_root() / self.config.bb_workspace / f"{repo_slug}.git"
+
+    def _migrate_repository_content(
+        self,
+        repo_slug: str,
+        source_url: str,
+        target_url: str,
+        reference_slug: Optional[str] = None,
+        existing: bool = False,
+    ) -> Optional[Set[str]]:
+        """Clone repository, or update its cached mirror, and push to new remote.
+
+        `existing` is set when the target was migrated by an earlier run and may already be up to date.
+        Returns the migrated branch names, or None if the migration failed.
+        """
+        # Nothing to push when GitHub already has every branch and tag at the same commit
+        source_refs = self._remote_refs(source_url) if existing else None
+        if source_refs is not None and source_refs == self._remote_refs(target_url):
+            logger.info(f"GitHub is up to date with {repo_slug}, skipping clone and push")
+            return {ref[len('refs/heads/'):] for ref in source_refs if ref.startswith('refs/heads/')}
+        if self.config.use_cache:
+            return self._sync_repository(repo_slug, source_url, target_url, self._cache_path(repo_slug), reference_slug)
         with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                logger.info(f"Cloning repository from Bitbucket...")
-                repo = git.Repo.clone_from(source_url, temp_dir, mirror=True)
+            return self._sync_repository(repo_slug, source_url, target_url, Path(temp_dir), reference_slug)
 
-                logger.info(f"Pushing repository to GitHub...")
-                repo.git.push('--mirror', target_url)
+    def _remote_refs(self, url: str) -> Optional[Dict[str, str]]:
+        """Branches and tags of a remote with their commits, None if it can't be listed"""
+        import git  # GitPython looks up the git executable on import
+        try:
+            command = git.Git()
+            command.update_environment(**GIT_ENV)
+            output = command.ls_remote('--heads', '--tags', url)
+        except Exception:
+            # The git error would repeat the URL with its credentials
+            logger.warning(f"Failed to list refs of {strip_credentials(url)}")
+            return None
+        return {ref: sha for sha, _, ref in (line.partition('\t') for line in output.splitlines())}
 
-                logger.info(f"Successfully migrated repository content")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to migrate repository content: {str(e)}")
-                return False
+    def _sync_repository(
+        self, repo_slug: str, source_url: str, target_url: str, path: Path, reference_slug: Optional[str]
+    ) -> Optional[Set[str]]:
+        """Bring the mirror at `path` up to date with Bitbucket and push it to GitHub"""
+        import git  # GitPython looks up the git executable on import
+        try:
+            if (path / 'HEAD').exists():
+                logger.info(f"Fetching {repo_slug} into cached mirror {path}...")
+                repo = git.Repo(path)
+                repo.git.update_environment(**GIT_ENV)
+                repo.git.fetch('--prune', source_url, '+refs/*:refs/*')
+            else:
+                logger.info(f"Cloning {repo_slug} from Bitbucket...")
+                options = ['--mirror']
+                reference = self._cache_path(reference_slug) if reference_slug else None
+                if reference is not None and (reference / 'HEAD').exists():
+                    # Only download objects missing from the parent, then copy the rest locally
+                    options += ['--reference-if-able', str(reference), '--dissociate']
+                path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                repo = git.Repo.clone_from(source_url, path, env=GIT_ENV, multi_options=options)
+                repo.git.update_environment(**GIT_ENV)
+                # Don't leave the Bitbucket credentials in the cached config
+                repo.git.remote('set-url', 'origin', strip_credentials(source_url))
+
+            logger.info(f"Pushing {repo_slug} to GitHub...")
+            # Atomic so a failed push doesn't leave GitHub with a partial set of refs
+            repo.git.push('--mirror', '--atomic', target_url)
+
+            logger.info(f"Successfully migrated repository content for {repo_slug}")
+            return {head.name for head in repo.heads}
+        except Exception as e:
+            logger.error(f"Failed to migrate repository content for {repo_slug}: {str(e)}")
+            return None
+
+
+_worker_migrator: Optional[Migrator] = None
+
+def _init_worker(config: MigrationConfig, log_level: int) -> None:
+    """Set up the Migrator of a worker process of Migrator.migrate_repositories"""
+    global _worker_migrator
+    # Spawned workers import the module afresh, keep the level the CLI chose
+    logger.setLevel(log_level)
+    _worker_migrator = Migrator(config)
+
+def _migrate_one(repo_slug: str) -> None:
+    """Migrate a repository in a worker process"""
+    _worker_migrator.migrate_single_repository(repo_slug)
@@ -0,0 +1,38 @@
+import httpx
+import pytest
+
+from bb_to_gh_migration import migration
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch, tmp_path):
+    """Keep caches, waits and rate limits of one test away from the others"""
+    monkeypatch.setenv('REPO_MIGRATOR_CACHE', str(tmp_path / 'cache'))
+    monkeypatch.setattr(migration, 'countdown', lambda seconds: None)
+    monkeypatch.setattr(migration, 'RATE_LIMITS', migration.RateLimiter())
+
+
+@pytest.fixture
+def config():
+    return migration.MigrationConfig('user', 'password', 'token', 'workspace', 'org', use_cache=False)
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Answer the requests of the retry transports with `handler`, returns the requests seen"""
+    def install(handler):
+        seen = []
+
+        def handle(request):
+            seen.append(request)
+            return handler(request)
+
+        mock = httpx.MockTransport(handle)
+        monkeypatch.setattr(httpx.HTTPTransport, 'handle_request', lambda self, request: mock.handle_request(request))
+
+        async def handle_async(self, request):
+            return mock.handle_request(request)
+
+        monkeypatch.setattr(httpx.AsyncHTTPTransport, 'handle_async_request', handle_async)
+        return seen
+    return install
@@ -0,0 +1,134 @@
+import threading
+
+import httpx
+import pytest
+
+from bb_to_gh_migration import migration
+
+
+@pytest.fixture
+def bb(config):
+    return migration.BitbucketConnector(config)
+
+
+def pages(count, requested, prefetched=None):
+    """_make_request stand-in serving `count` linked pages, recording the URLs asked for"""
+    def make_request(method, url, params=None):
+        requested.append(url)
+        number = int(url.rsplit('=', 1)[1]) if '=' in url else 1
+        if prefetched is not None and number > 1:
+            prefetched.set()
+        page = {'values': [number]}
+        if number < count:
+            page['next'] = f"https://api.example/list?page={number + 1}"
+        return page
+    return make_request
+
+
+def test_paginate_prefetches_the_next_page(bb):
+    requested, prefetched = [], threading.Event()
+    bb._make_request = pages(2, requested, prefetched)
+    listing = bb._paginate('https://api.example/list')
+    assert next(listing) == [1]
+    # Page 2 is on its way before the caller asks for it
+    assert prefetched.wait(5)
+    assert list(listing) == [[2]]
+
+
+def test_paginate_stops_fetching_when_the_caller_stops(bb):
+    requested = []
+    bb._make_request = pages(5, requested)
+    listing = bb._paginate('https://api.example/list')
+    assert next(listing) == [1]
+    listing.close()
+    assert len(requested) <= 2
+
+
+def test_paginate_sends_the_page_size_on_the_first_request_only(bb):
+    seen = []
+
+    def make_request(method, url, params=None):
+        seen.append(params)
+        return {'values': [], 'next': 'https://api.example/list?page=2'} if len(seen) == 1 else {'values': []}
+
+    bb._make_request = make_request
+    list(bb._paginate('https://api.example/list', {'fields': 'next'}, pagelen=50))
+    assert seen == [{'fields': 'next', 'pagelen': 50}, None]
+
+
+def test_missing_issue_tracker_yields_nothing(bb):
+    bb._make_request = lambda method, url, params=None: None
+    assert list(bb.iter_issues('repo')) == []
+
+
+@pytest.fixture
+def cached_bb(config):
+    config.use_cache = True
+    return migration.BitbucketConnector(config)
+
+
+def etag_server(body=b'{"values": [1]}'):
+    """Handler answering 304 to requests revalidating its ETag"""
+    def handler(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304, headers={'ETag': '"v1"'})
+        return httpx.Response(200, headers={'ETag': '"v1"'}, content=body)
+    return handler
+
+
+def test_response_cache_replays_unchanged_responses(serve, cached_bb, config):
+    seen = serve(etag_server())
+    url = 'https://api.bitbucket.org/2.0/repositories/workspace'
+    assert cached_bb._make_request('GET', url, params={'pagelen': 100}) == {'values': [1]}
+
+    # A later run revalidates and reuses the stored body
+    again = migration.BitbucketConnector(config)
+    assert again._make_request('GET', url, params={'pagelen': 100}) == {'values': [1]}
+    assert [request.headers.get('If-None-Match') for request in seen] == [None, '"v1"']
+
+
+def test_response_cache_is_private_and_per_workspace(serve, cached_bb, config):
+    serve(etag_server())
+    cached_bb._make_request('GET', 'https://api.bitbucket.org/2.0/user')
+    path = migration.cache_root() / 'workspace' / 'responses.sqlite'
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+
+    other = migration.ResponseCache(path, 'other-workspace')
+    assert other.get('https://api.bitbucket.org/2.0/user') is None
+
+
+def test_no_cache_never_revalidates(serve, bb):
+    seen = serve(etag_server())
+    url = 'https://api.bitbucket.org/2.0/user'
+    bb._make_request('GET', url)
+    bb._make_request('GET', url)
+    assert bb.responses is None
+    assert [request.headers.get('If-None-Match') for request in seen] == [None, None]
+
+
+def pull_request_pages(request):
+    """Handler serving two pages of open pull requests, each with one comment"""
+    path = request.url.path
+    if path.endswith('/comments'):
+        return httpx.Response(200, json={'values': [{'content': {'raw': 'Looks good'}}]})
+    if 'page' not in request.url.params:
+        return httpx.Response(200, json={
+            'values': [{'id': 1, 'title': 'First'}, {'id': 2, 'title': 'Second'}],
+            'next': f"https://api.bitbucket.org{path}?page=2",
+        })
+    return httpx.Response(200, json={'values': [{'id': 3, 'title': 'Third'}]})
+
+
+def test_pull_request_listing_without_comments(serve, bb):
+    seen = serve(pull_request_pages)
+    prs = bb.get_pull_requests('repo', include_comments=False)
+    assert [pr['title'] for pr in prs] == ['First', 'Second', 'Third']
+    assert not any(request.url.path.endswith('/comments') for request in seen)
+    assert len(seen) == 2
+
+
+def test_pull_requests_come_with_their_comments(serve, bb):
+    serve(pull_request_pages)
+    prs = bb.get_pull_requests('repo')
+    assert [len(pr['comments']) for pr in prs] == [1, 1, 1]
@@ -0,0 +1,77 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from bb_to_gh_migration import migration
+
+
+class Clock:
+    """Stand-in for the time module where sleeping only moves the clock forward"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return time.time() + self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def gh(monkeypatch, config):
+    monkeypatch.setattr(migration.GitHubConnector, '_setup_client', lambda self: None)
+    monkeypatch.setattr(migration, 'time', Clock())
+    return migration.GitHubConnector(config)
+
+
+def import_queue(statuses):
+    """Handler queuing one import per POST, each listing answers import `id` with the next of `statuses[id]`"""
+    def handler(request):
+        if request.method == 'POST':
+            title = json.loads(request.content)['issue']['title']
+            return httpx.Response(202, json={'id': int(title), 'status': 'pending', 'created_at': '2024-05-01T10:00:00+00:00'})
+        if request.url.path.endswith('/import/issues'):
+            listing = [{'id': 99, 'status': 'imported'}]  # Queued by an earlier run
+            for import_id, replies in statuses.items():
+                reply = replies.pop(0) if len(replies) > 1 else replies[0]
+                listing.append({'id': import_id, **{key: value for key, value in reply.items() if key != 'errors'}})
+            return httpx.Response(200, json=listing)
+        import_id = int(request.url.path.rsplit('/', 1)[1])
+        return httpx.Response(200, json={'id': import_id, **statuses[import_id][0]})
+    return handler
+
+
+def test_bulk_import_polls_one_listing_for_the_batch(serve, gh, caplog):
+    seen = serve(import_queue({
+        1: [{'status': 'pending'}, {'status': 'imported'}],
+        2: [{'status': 'failed', 'errors': ['invalid']}],
+        3: [{'status': 'imported'}],
+    }))
+    issues = [{'title': str(number), 'state': 'new'} for number in (1, 2, 3)]
+    assert gh.bulk_import_issues('repo', issues) == 2
+    polls = [request for request in seen if request.method == 'GET']
+    # Two listings, plus the details of the failed import
+    assert [request.url.path.rsplit('/', 1)[1] for request in polls] == ['issues', '2', 'issues']
+    assert polls[0].url.params['since'] == '2024-05-01T10:00:00+00:00'
+    assert "GitHub failed to import issue 2: ['invalid']" in caplog.text
+
+
+def test_bulk_import_reports_imports_pending_at_timeout(serve, gh, caplog):
+    serve(import_queue({1: [{'status': 'imported'}], 2: [{'status': 'pending'}], 3: [{'status': 'pending'}]}))
+    issues = [{'title': str(number), 'state': 'new'} for number in (1, 2, 3)]
+    assert gh.bulk_import_issues('repo', issues) == 1
+    assert 'Import 2 of issue 2 still pending' in caplog.text
+    assert 'Import 3 of issue 3 still pending' in caplog.text
+
+
+def test_issue_import_payload_keeps_state_and_date(gh):
+    payload = gh._issue_import_payload({'title': 'Bug', 'state': 'resolved', 'created_on': '2020-01-02T03:04:05+00:00'})
+    assert payload['issue']['closed'] is True
+    assert payload['issue']['created_at'] == '2020-01-02T03:04:05+00:00'
+    assert payload['issue']['labels'] == ['migrated-from-bitbucket', 'resolved']
@@ -0,0 +1,135 @@
+import httpx
+import pytest
+
+from bb_to_gh_migration import migration
+
+
+@pytest.fixture
+def gh(monkeypatch, config):
+    monkeypatch.setattr(migration.GitHubConnector, '_setup_client', lambda self: None)
+    return migration.GitHubConnector(config)
+
+
+def item(number, title=None):
+    return {'title': title or f"Item {number}", 'links': {'html': {'href': f"https://bitbucket.org/workspace/repo/{number}"}}}
+
+
+def test_skip_migrated_leaves_out_known_links(config):
+    migrator = migration.Migrator.__new__(migration.Migrator)
+    migrator.config = config
+    kept = migrator._skip_migrated([item(1), item(2), {'title': 'No links'}], {'https://bitbucket.org/workspace/repo/1'})
+    assert [each['title'] for each in kept] == ['Item 2', 'No links']
+
+
+def test_get_migrated_links_reads_every_page(serve, gh):
+    def handler(request):
+        if request.url.path.endswith('/pulls'):
+            return httpx.Response(200, json=[{'body': 'Original Link: https://bitbucket.org/pr/1'}])
+        if 'page' not in request.url.params:
+            assert request.url.params['labels'] == 'migrated-from-bitbucket'
+            return httpx.Response(200, headers={'Link': '<https://api.github.com/next?page=2>; rel="next"'}, json=[
+                {'body': '**Reporter:** someone\nOriginal Link: https://bitbucket.org/issue/1\n'},
+                {'body': None},
+            ])
+        return httpx.Response(200, json=[{'body': 'Original Link: https://bitbucket.org/issue/2'}])
+
+    seen = serve(handler)
+    issues, prs = gh.get_migrated_links('repo')
+    assert issues == {'https://bitbucket.org/issue/1', 'https://bitbucket.org/issue/2'}
+    assert prs == {'https://bitbucket.org/pr/1'}
+    assert len(seen) == 3
+
+
+class FakeBitbucket:
+    def get_repository_details(self, repo_slug):
+        return {'description': '', 'is_private': True}
+
+    def count_issues(self, repo_slug):
+        return 2
+
+    def get_pull_requests(self, repo_slug):
+        return [item(10)]
+
+    def iter_issues(self, repo_slug):
+        return iter([item(1), item(2)])
+
+    def get_clone_url(self, repo_slug):
+        return 'https://bitbucket.org/workspace/repo.git'
+
+
+class FakeGitHub:
+    def __init__(self, repository):
+        self.repository = repository
+        self.created = False
+        self.issues, self.prs = [], []
+
+    def get_repository(self, name):
+        return self.repository
+
+    def get_migrated_links(self, repo_name):
+        return {'https://bitbucket.org/workspace/repo/1'}, {'https://bitbucket.org/workspace/repo/10'}
+
+    def create_repository(self, name, description, private):
+        self.created = True
+        return {'full_name': f"org/{name}"}
+
+    def get_clone_url(self, repo_slug):
+        return 'https://github.com/org/repo.git'
+
+    def bulk_import_issues(self, repo_name, issues):
+        self.issues = list(issues)
+        return len(self.issues)
+
+    def create_pull_requests(self, repo_name, prs, branches):
+        self.prs = prs
+        return len(prs)
+
+
+@pytest.fixture
+def migrate(config):
+    """Run migrate_single_repository against `repository` on GitHub, returns the fake and the content calls"""
+    def run(repository):
+        migrator = migration.Migrator.__new__(migration.Migrator)
+        migrator.config = config
+        migrator.bb, migrator.gh = FakeBitbucket(), FakeGitHub(repository)
+        calls = []
+        migrator._migrate_repository_content = lambda *args: calls.append(args) or {'main'}
+        migrator.migrate_single_repository('repo')
+        return migrator.gh, calls
+    return run
+
+
+def test_new_repository_is_created_and_fully_migrated(migrate):
+    gh, calls = migrate(None)
+    assert gh.created
+    assert calls[0][-1] is False
+    assert [issue['title'] for issue in gh.issues] == ['Item 1', 'Item 2']
+    assert [pr['title'] for pr in gh.prs] == ['Item 10']
+
+
+def test_rerun_only_adds_what_is_missing(migrate):
+    gh, calls = migrate({'full_name': 'org/repo', 'topics': [migration.MIGRATION_TOPIC]})
+    assert not gh.created
+    assert calls[0][-1] is True
+    assert [issue['title'] for issue in gh.issues] == ['Item 2']
+    assert gh.prs == []
+
+
+def test_repository_not_created_by_the_tool_is_left_alone(migrate):
+    gh, calls = migrate({'full_name': 'org/repo', 'topics': []})
+    assert calls == []
+    assert gh.issues == [] and gh.prs == []
+
+
+def test_new_repository_skips_the_remote_comparison(monkeypatch, config):
+    migrator = migration.Migrator.__new__(migration.Migrator)
+    migrator.config = config
+    listed = []
+    monkeypatch.setattr(migrator, '_remote_refs', lambda url: listed.append(url) or {})
+    monkeypatch.setattr(migrator, '_sync_repository', lambda *args: {'main'})
+    assert migrator._migrate_repository_content('repo', 'source', 'target') == {'main'}
+    assert listed == []
+
+    # Both sides listing the same refs means there is nothing to push
+    monkeypatch.setattr(migrator, '_remote_refs', lambda url: {'refs/heads/dev': 'abc'})
+    assert migrator._migrate_repository_content('repo', 'source', 'target', existing=True) == {'dev'}
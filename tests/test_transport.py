@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+
+import httpx
+import pytest
+
+from bb_to_gh_migration import migration
+
+jittered = migration.jittered
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(migration, 'jittered', lambda backoff: 0)
+
+
+def replies(*responses):
+    """Handler answering with `responses` in turn, a response is a status or (status, headers)"""
+    queue = list(responses)
+
+    def handler(request):
+        reply = queue.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        status, headers = reply if isinstance(reply, tuple) else (reply, {})
+        return httpx.Response(status, headers=headers, json={})
+    return handler
+
+
+def test_get_is_retried_on_server_errors(serve):
+    seen = serve(replies(502, 503, 200))
+    assert migration.new_client().get('https://api.example/')
+    assert len(seen) == 3
+
+
+def test_post_is_not_retried_on_server_errors(serve):
+    seen = serve(replies(502, 201))
+    assert migration.new_client().post('https://api.example/', json={}).status_code == 502
+    assert len(seen) == 1
+
+
+@pytest.mark.parametrize('reply', [
+    429,
+    (403, {'X-RateLimit-Remaining': '0'}),
+    (403, {'Retry-After': '0'}),
+])
+def test_post_is_retried_when_rate_limited(serve, reply):
+    seen = serve(replies(reply, 201))
+    assert migration.new_client().post('https://api.example/', json={}).status_code == 201
+    assert len(seen) == 2
+
+
+def test_post_forbidden_without_rate_limit_is_not_retried(serve):
+    seen = serve(replies(403, 201))
+    assert migration.new_client().post('https://api.example/', json={}).status_code == 403
+    assert len(seen) == 1
+
+
+def test_post_is_retried_only_when_never_sent(serve):
+    seen = serve(replies(httpx.ConnectError('refused'), 201))
+    assert migration.new_client().post('https://api.example/', json={}).status_code == 201
+    assert len(seen) == 2
+
+    seen = serve(replies(httpx.ReadTimeout('lost'), 201))
+    with pytest.raises(httpx.ReadTimeout):
+        migration.new_client().post('https://api.example/', json={})
+    assert len(seen) == 1
+
+
+def test_gives_up_after_retry_total(serve):
+    seen = serve(replies(*[500] * (migration.RETRY_TOTAL + 1)))
+    assert migration.new_client().get('https://api.example/').status_code == 500
+    assert len(seen) == migration.RETRY_TOTAL + 1
+
+
+def test_async_transport_applies_the_same_rules(serve):
+    seen = serve(replies(502, 200, 502))
+
+    async def run():
+        async with migration.new_async_client() as client:
+            return (await client.get('https://api.example/')).status_code, \
+                (await client.post('https://api.example/', json={})).status_code
+
+    assert asyncio.run(run()) == (200, 502)
+    assert [request.method for request in seen] == ['GET', 'GET', 'POST']
+
+
+def test_retry_delay_prefers_server_hints():
+    assert migration.retry_delay({'Retry-After': '7'}, 0) == 7
+    reset = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(time.time() + 30)}
+    assert 25 < migration.retry_delay(reset, 0) <= 30
+
+
+def test_backoff_is_jittered_and_capped(monkeypatch):
+    monkeypatch.setattr(migration, 'jittered', jittered)
+    delays = [migration.retry_delay({}, 10) for _ in range(50)]
+    assert all(0 <= delay <= migration.RETRY_BACKOFF_MAX for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_rate_limiter_holds_requests_until_reset():
+    limiter = migration.RateLimiter()
+    limiter.update('api.example', {'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset': str(time.time() + 30)})
+    assert limiter.delay('api.example') == 0
+    limiter.update('api.example', {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(time.time() + 30)})
+    assert 25 < limiter.delay('api.example') <= 30
+    assert limiter.delay('other.example') == 0
+
+
+def test_pygithub_policy_only_retries_reads():
+    policy = migration.RETRY_POLICY
+    assert policy.is_retry('GET', 502)
+    assert policy.is_retry('GET', 403)
+    assert not policy.is_retry('POST', 429)
+    assert not policy.is_retry('PATCH', 500)
+
+
+def test_requests_are_not_logged_by_default(serve, caplog):
+    serve(replies(200))
+    with caplog.at_level(logging.INFO):
+        migration.new_client().get('https://api.example/')
+    assert 'HTTP Request' not in caplog.text